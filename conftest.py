@@ -1,13 +1,18 @@
 """Main framework-only testing suite.
 """
-import contextlib
 import os
+from typing import Callable
 
-from pytest import fixture
+from pytest import MonkeyPatch, fixture
 
 from orwynn.app.App import App
 from orwynn.app.app_test import std_app
-from orwynn.boot.Boot import Boot
+from orwynn.boot.Boot import (
+    _ENV_APP_RC_PATH,
+    _ENV_MODE,
+    _ENV_ROOT_DIR,
+    Boot,
+)
 from orwynn.boot.boot_test import run_std, std_boot, std_mongo_boot
 from orwynn.boot.BootMode import BootMode
 from orwynn.controller.endpoint.endpoint_test import run_endpoint
@@ -18,6 +23,7 @@ from orwynn.di.collecting.collect_provider_dependencies_test import (
 from orwynn.di.di_test import std_di_container
 from orwynn.module.Module import Module
 from orwynn.mongo.Mongo import Mongo
+from orwynn.mongo.MongoConfig import MongoConfig
 from orwynn.proxy.boot_data_proxy_test import std_boot_data_proxy
 from orwynn.test.Client import Client
 from orwynn.test.EmbeddedTestClient import EmbeddedTestClient
@@ -31,19 +37,62 @@ from tests.structs import (
 )
 
 
+@fixture(autouse=True, scope="session")
+def mongo_database_per_xdist_worker():
+    # Each pytest-xdist worker operates on its own database, e.g.
+    # "orwynntest_gw0", to not race with other workers on drops
+    xdist_worker: str | None = os.environ.get("PYTEST_XDIST_WORKER")
+    if not xdist_worker:
+        yield
+        return
+
+    original_load = MongoConfig.load.__func__
+
+    def load(cls, **kwargs) -> MongoConfig:
+        config: MongoConfig = original_load(cls, **kwargs)
+        config.database_name = f"{config.database_name}_{xdist_worker}"
+        return config
+
+    with MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(MongoConfig, "load", classmethod(load))
+        yield
+
+
 @fixture(autouse=True)
 def run_around_tests():
     yield
 
-    # Suppress: Mongo is not initialized, skip
-    with contextlib.suppress(TypeError):
-        Mongo.ie().drop_database()
+    # Clean database only if some test has really initialized Mongo. Pooled
+    # client connections are kept alive for next tests.
+    if Mongo.is_initialized():
+        Mongo.ie().truncate_collections()
     __discardWorkers()
+    # Tests set these environs directly, so they are still reset for each
+    # test, e.g. not to let an incorrect mode leak to the next Boot
+    os.environ[_ENV_MODE] = ""
+    os.environ[_ENV_ROOT_DIR] = ""
+    os.environ[_ENV_APP_RC_PATH] = ""
+
+
+@fixture
+def discard_workers() -> Callable[[], None]:
+    """Gives function discarding all initialized workers, e.g. to construct
+    several Boots within a test."""
+    return __discardWorkers
+
+
+def __discardWorkers():
+    for W in __collectWorkers():
+        if W.is_initialized():
+            W.discard(should_validate=False)
+
+
+def __collectWorkers() -> list[type[Worker]]:
+    # Traverse subclasses tree once per call into a flat list, since new
+    # workers might be defined by any test
+    result: list[type[Worker]] = [Worker]
+
+    for W in result:
+        result.extend(W.__subclasses__())
 
-def __discardWorkers(W: type[Worker] = Worker):
-    for NestedW in W.__subclasses__():
-        __discardWorkers(NestedW)
-    W.discard(should_validate=False)
-    os.environ["Orwynn_Mode"] = ""
-    os.environ["Orwynn_RootDir"] = ""
-    os.environ["Orwynn_AppRcDir"] = ""
+    return result
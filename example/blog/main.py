@@ -12,6 +12,8 @@ from orwynn import (
     validation,
 )
 
+MAX_USERS_LIMIT: int = 1000
+
 
 class UserIn(Model):
     username: str
@@ -41,8 +43,13 @@ class UserService(Service):
         validation.validate(id, str)
         return User.find_one({"id": id})
 
-    def find_all(self) -> Iterable[User]:
-        return User.find_all()
+    def find_all(self, *, limit: int, skip: int = 0) -> Iterable[User]:
+        # Limit is clamped since zero limit means "no limit" for mongo, which
+        # would fetch the whole collection
+        return User.find_all(
+            limit=min(max(limit, 1), MAX_USERS_LIMIT),
+            skip=max(skip, 0)
+        )
 
 
 class UsersIdController(HTTPController):
@@ -65,9 +72,11 @@ class UsersController(HTTPController):
         super().__init__()
         self.sv = sv
 
-    def get(self) -> Users:
+    def get(self, limit: int = 100, skip: int = 0) -> Users:
+        # Users are paginated to not buffer the whole collection in memory on
+        # every request
         return Users(
-            users=list(self.sv.find_all())
+            users=list(self.sv.find_all(limit=limit, skip=skip))
         )
 
     def post(self, user: UserIn) -> User:
@@ -23,7 +23,6 @@ from orwynn.log.Log import Log
 from orwynn.middleware.Middleware import Middleware
 from orwynn.model.Model import Model
 from orwynn.module.Module import Module
-from orwynn.mongo.Document import Document
 
 # Proxies #
 from orwynn.proxy.BootProxy import BootProxy
@@ -31,3 +30,16 @@ from orwynn.service.Service import Service
 from orwynn.test.Client import Client
 from orwynn.test.EmbeddedTestClient import EmbeddedTestClient
 from orwynn.test.Test import Test
+
+
+def __getattr__(name: str):
+    # Mongo-related objects are imported lazily, so apps not using MongoDB
+    # don't pay for pymongo import
+    if name == "Document":
+        from orwynn.mongo.Document import Document
+        globals()["Document"] = Document
+        return Document
+    elif name == "mongo":
+        import orwynn.mongo
+        return orwynn.mongo
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
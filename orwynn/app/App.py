@@ -23,16 +23,6 @@ class App(FrameworkService):
     def __init__(self) -> None:
         self.__app: FastAPI = FastAPI(docs_url="/doc")
 
-        self.HTTP_METHODS_TO_REGISTERING_FUNCTIONS: \
-            dict[HTTPMethod, Callable] = {
-                HTTPMethod.GET: self.__app.get,
-                HTTPMethod.POST: self.__app.post,
-                HTTPMethod.PUT: self.__app.put,
-                HTTPMethod.DELETE: self.__app.delete,
-                HTTPMethod.PATCH: self.__app.patch,
-                HTTPMethod.OPTIONS: self.__app.options
-            }
-
         self.__is_cors_configured: bool = False
         self.__client: Client = Client(EmbeddedTestClient(self.__app))
 
@@ -49,6 +39,33 @@ class App(FrameworkService):
     def client(self) -> Client:
         return self.__client
 
+    def register_route_fn(
+        self,
+        *,
+        route: str,
+        fn: Callable,
+        methods: list[HTTPMethod],
+        **kwargs
+    ) -> None:
+        """Registers fn for route handling all given methods.
+
+        Attributes:
+            route:
+                Route to register to.
+            fn:
+                Function to register.
+            methods:
+                HTTP methods function is handling.
+            kwargs:
+                Additional FastAPI route parameters, e.g. "status_code".
+        """
+        self.__app.add_api_route(
+            route,
+            fn,
+            methods=[method.value for method in methods],
+            **kwargs
+        )
+
     def add_middleware(self, middleware: Middleware) -> None:
         validation.validate(middleware, Middleware)
         # Note that dispatch(...) method is linked to be as entrypoint to
@@ -1,17 +1,16 @@
-import contextlib
+import copy
+import functools
 import os
 import re
 from pathlib import Path
 from types import NoneType
+from typing import ClassVar
 
 import dotenv
 
 from orwynn.app.App import App
 from orwynn.app.DefaultErrorHandler import DefaultErrorHandler
 from orwynn.app.DefaultExceptionHandler import DefaultExceptionHandler
-from orwynn.app.DefaultHTTPExceptionHandler import DefaultHTTPExceptionHandler
-from orwynn.app.DefaultRequestValidationExceptionHandler import \
-    DefaultRequestValidationExceptionHandler
 from orwynn.app.ErrorHandler import ErrorHandler
 from orwynn.app_rc.APP_RC_MODE_NESTING import APP_RC_MODE_NESTING
 from orwynn.app_rc.AppRC import AppRC
@@ -34,23 +33,45 @@ from orwynn.file.NotDirError import NotDirError
 from orwynn.indication.default_api_indication import default_api_indication
 from orwynn.indication.Indication import Indication
 from orwynn.log.configure_log import configure_log
-from orwynn.log.Log import Log
 from orwynn.log.LogConfig import LogConfig
 from orwynn.middleware.Middleware import Middleware
 from orwynn.module.Module import Module
-from orwynn.mongo.Mongo import Mongo
-from orwynn.mongo.MongoConfig import MongoConfig
 from orwynn.proxy.APIIndicationOnlyProxy import APIIndicationOnlyProxy
 from orwynn.proxy.BootProxy import BootProxy
 from orwynn.proxy.EndpointProxy import EndpointProxy
 from orwynn.router.Router import Router
-from orwynn import validation, web
-from orwynn.file.yml import load_yml
+from orwynn import web
+from orwynn.file.yml import check_unset_env, load_yml_with_env
 from orwynn.validation import (RequestValidationException, validate,
                                     validate_each)
-from orwynn.web import CORS, HTTPException, HTTPMethod
+from orwynn.web import CORS, HTTPException
 from orwynn.worker.Worker import Worker
 
+# Environment variables read on boot
+_ENV_MODE: str = "Orwynn_Mode"
+_ENV_ROOT_DIR: str = "Orwynn_RootDir"
+_ENV_APP_RC_PATH: str = "Orwynn_AppRCPath"
+
+_APP_RC_CACHE_MAX_SIZE: int = 32
+_URL_SCHEMES: tuple[str, ...] = ("http://", "https://")
+_SUPPORTED_APP_RC_KEYS: frozenset[str] = frozenset(x.value for x in BootMode)
+# Values of apprc sections applied for each mode, from bottom to top
+_NESTED_MODE_VALUES_BY_MODE: dict[BootMode, tuple[str, ...]] = {
+    mode: tuple(m.value for m in APP_RC_MODE_NESTING[:i + 1])
+    for i, mode in enumerate(APP_RC_MODE_NESTING)
+}
+
+
+@functools.lru_cache
+def _require_dir(path: Path) -> Path:
+    # Only successful checks are cached (raised errors are not), so the
+    # directory is stat'ed once per process instead of once per Boot
+    if not path.is_dir():
+        raise NotDirError(
+            f"{path} is not a directory"
+        )
+    return path
+
 
 class Boot(Worker):
     """Worker responsible of booting an application.
@@ -62,7 +83,8 @@ class Boot(Worker):
         root_module:
             Root module of the app.
         dotenv_path (optional):
-            Path to .env file. Defaults to ".env".
+            Path to .env file. Defaults to ".env". Each file is loaded only
+            once per process, see Boot.reload_dotenv() to force loading.
         api_indication (optional):
             Indication object used as a convention for outcoming API
             structures. Defaults to predefined by framework's indication
@@ -98,7 +120,23 @@ class Boot(Worker):
     ).app
     ```
     """
-    @Log.catch(reraise=True)
+    # Names are mangled by python the same way as for attributes
+    __slots__ = (
+        "__mode",
+        "__root_dir",
+        "__api_indication",
+        "__app_rc",
+        "__di",
+        "__app",
+        "__router"
+    )
+
+    # Parsed apprc with environment variables substituted into it
+    __app_rc_cache: ClassVar[
+        dict[tuple[str, BootMode, int], tuple[AppRC, dict[str, str | None]]]
+    ] = {}
+    __loaded_dotenv_paths: ClassVar[set[Path]] = set()
+
     def __init__(
         self,
         root_module: Module,
@@ -124,7 +162,7 @@ class Boot(Worker):
             ErrorHandlers, ErrorHandler, expected_sequence_type=list
         )
 
-        dotenv.load_dotenv(dotenv_path, override=True)
+        self.__load_dotenv(dotenv_path)
 
         self.__mode: BootMode = self.__parse_mode()
         self.__root_dir: Path = self.__parse_root_dir()
@@ -150,31 +188,41 @@ class Boot(Worker):
         else:
             validate_each(databases, DatabaseKind, expected_sequence_type=list)
 
-        # Add crucial builtin objects
-        root_module.add_provider_or_skip(App)
-        root_module.add_provider_or_skip(LogConfig)
-
         self.__enable_databases(databases)
-        self.__di: DI = DI(root_module)
+        # Crucial builtin objects are passed to DI separately to leave user's
+        # root module untouched and safe to reuse across many Boots
+        self.__di: DI = DI(
+            root_module,
+            extra_providers=[App, LogConfig]
+        )
+
+        # App is fetched from DI once, since it's accessed a lot while
+        # registering routes, middleware and error handlers
+        self.__app: App = self.__di.app_service
 
         self.__router: Router = Router(
-            self.app
+            self.__app
         )
 
         self.__configure_log()
 
+        # All routes are registered eagerly at boot, and DI collections are
+        # fetched once to be traversed in a single pass
         try:
-            self.__register_routes(self.__di.modules, self.__di.controllers)
+            controllers: list[Controller] = self.__di.controllers
         except MissingDIObjectError:
             # Don't raise error to ease test writings
             pass
+        else:
+            self.__register_routes(self.__di.modules, controllers)
+
         try:
-            self.__register_middleware(
-                self.__di.all_middleware
-            )
+            middleware: list[Middleware] = self.__di.all_middleware
         except MissingDIObjectError:
             # No middleware defined, it's ok
             pass
+        else:
+            self.__register_middleware(middleware)
 
         if cors is not None:
             self.app.configure_cors(cors)
@@ -183,7 +231,7 @@ class Boot(Worker):
 
     @property
     def app(self) -> App:
-        return self.__di.app_service
+        return self.__app
 
     @property
     def mode(self) -> BootMode:
@@ -193,12 +241,39 @@ class Boot(Worker):
     def api_indication(self) -> Indication:
         return self.__api_indication
 
+    @classmethod
+    def reload_dotenv(cls, dotenv_path: Path | None = None) -> None:
+        """Loads .env file overriding current environs.
+
+        Every .env file is loaded by Boot only once per process, so this
+        method should be used if the file has to be applied once again, e.g.
+        after environs have been changed in tests.
+
+        Args:
+            dotenv_path (optional):
+                Path to .env file. Defaults to ".env".
+        """
+        if dotenv_path is None:
+            dotenv_path = Path(".env")
+        validate(dotenv_path, Path)
+
+        cls.__load_dotenv(dotenv_path, should_force=True)
+
+    @classmethod
+    def __load_dotenv(
+        cls, dotenv_path: Path, *, should_force: bool = False
+    ) -> None:
+        resolved_path: Path = dotenv_path.resolve()
+        if not should_force and resolved_path in cls.__loaded_dotenv_paths:
+            return
+
+        # Path is remembered only if loading succeeded, so a file created
+        # later is still picked up by the next Boot
+        if dotenv.load_dotenv(resolved_path, override=True):
+            cls.__loaded_dotenv_paths.add(resolved_path)
+
     def __configure_log(self) -> None:
-        log_config: LogConfig = validation.apply(
-            self.__di.find("LogConfig"),
-            LogConfig
-        )
-        configure_log(log_config)
+        configure_log(self.__di.find(LogConfig))
 
     def __register_error_handlers(
         self
@@ -209,11 +284,15 @@ class Boot(Worker):
         except MissingDIObjectError:
             error_handlers = []
 
-        HandledBuiltinExceptions: list[type[Exception]] = []
-        is_default_error_handled: bool = False
-
-        HandledBuiltinExceptions, is_default_error_handled = \
-            self.__collect_error_handlers_data(error_handlers)
+        HandledBuiltinExceptions: list[type[Exception]]
+        is_default_error_handled: bool
+        if not error_handlers:
+            # Nothing to resolve against user's handlers, only defaults are
+            # added
+            HandledBuiltinExceptions, is_default_error_handled = [], False
+        else:
+            HandledBuiltinExceptions, is_default_error_handled = \
+                self.__collect_error_handlers_data(error_handlers)
 
         self.__add_error_handlers(
             error_handlers=error_handlers,
@@ -231,23 +310,20 @@ class Boot(Worker):
         for error_handler in error_handlers:
             if error_handler.E is None:
                 raise MalfunctionError()
-            elif isinstance(error_handler.E, list):
-                for E in error_handler.E:
-                    if (
-                        issubclass(E, Exception)
-                        and not issubclass(E, Error)
-                    ):
-                        HandledBuiltinExceptions.append(E)
-                    elif E is Error:
-                        is_default_error_handled = True
-            else:
-                if (
-                    issubclass(error_handler.E, Exception)
-                    and not issubclass(error_handler.E, Error)
-                ):
-                    HandledBuiltinExceptions.append(error_handler.E)
-                elif error_handler.E is Error:
+
+            Es: list[type[Exception]] | tuple[type[Exception]] = (
+                error_handler.E
+                if isinstance(error_handler.E, list)
+                else (error_handler.E,)
+            )
+            for E in Es:
+                if E is Error:
                     is_default_error_handled = True
+                elif (
+                    issubclass(E, Exception)
+                    and not issubclass(E, Error)
+                ):
+                    HandledBuiltinExceptions.append(E)
 
         return HandledBuiltinExceptions, is_default_error_handled
 
@@ -264,20 +340,25 @@ class Boot(Worker):
         # For any unhandled builtin exception add default handler,
         # also add special RequestValidationException since it's not direct
         # subclass of exception
-        RemainingExceptionSubclasses = \
+        AllExceptionSubclasses: list[type[Exception]] = \
             get_non_framework_exceptions() + [RequestValidationException]
+        RemainingExceptionSubclasses: set[type[Exception]] = \
+            set(AllExceptionSubclasses)
         for HandledException in HandledBuiltinExceptions:
-            try:
-                RemainingExceptionSubclasses.remove(HandledException)
-            except ValueError:
+            if HandledException not in RemainingExceptionSubclasses:
                 raise MalfunctionError()
+            RemainingExceptionSubclasses.discard(HandledException)
 
         # Handle special exceptions
         if HTTPException in RemainingExceptionSubclasses:
-            RemainingExceptionSubclasses.remove(HTTPException)
+            from orwynn.app.DefaultHTTPExceptionHandler import \
+                DefaultHTTPExceptionHandler
+            RemainingExceptionSubclasses.discard(HTTPException)
             self.app.add_error_handler(DefaultHTTPExceptionHandler())
         if RequestValidationException in RemainingExceptionSubclasses:
-            RemainingExceptionSubclasses.remove(RequestValidationException)
+            from orwynn.app.DefaultRequestValidationExceptionHandler import \
+                DefaultRequestValidationExceptionHandler
+            RemainingExceptionSubclasses.discard(RequestValidationException)
             self.app.add_error_handler(
                 DefaultRequestValidationExceptionHandler()
             )
@@ -285,9 +366,11 @@ class Boot(Worker):
         if RemainingExceptionSubclasses:
             default_exception_handler: DefaultExceptionHandler = \
                 DefaultExceptionHandler()
-            default_exception_handler.set_handled_exception(
-                RemainingExceptionSubclasses
-            )
+            # Keep original order of exceptions for handlers registration
+            default_exception_handler.set_handled_exception([
+                E for E in AllExceptionSubclasses
+                if E in RemainingExceptionSubclasses
+            ])
             self.app.add_error_handler(default_exception_handler)
 
         if not is_default_error_handled:
@@ -299,9 +382,18 @@ class Boot(Worker):
     def __register_routes(
         self, modules: list[Module], controllers: list[Controller]
     ) -> None:
+        # Index controllers by their classes once, to not scan all of them for
+        # every module's controller class. DI container holds only one
+        # instance per controller class.
+        controller_by_type: dict[type[Controller], Controller] = {
+            type(c): c for c in controllers
+        }
+
         for m in modules:
-            for C in m.Controllers:
-                self.__register_controller_class_for_module(m, C, controllers)
+            for C in m._Controllers:
+                self.__register_controller_class_for_module(
+                    m, C, controller_by_type
+                )
 
     def __register_middleware(self, middleware: list[Middleware]) -> None:
         for m in middleware:
@@ -311,55 +403,52 @@ class Boot(Worker):
         self,
         m: Module,
         C: type[Controller],
-        controllers: list[Controller]
+        controller_by_type: dict[type[Controller], Controller]
     ) -> None:
-        is_controller_found: bool = False
-        for c in controllers:
-            if type(c) is C:
-                is_controller_found = True
-
-                if isinstance(c, HTTPController):
-                    self.__register_http_for_module(c, m)
-                elif isinstance(c, WebsocketController):
-                    self.__register_websocket_controller_for_module(c, m)
-                else:
-                    raise TypeError(
-                        f"controller unsupported type {type(c)}"
-                    )
-        if not is_controller_found:
+        c: Controller | None = controller_by_type.get(C, None)
+
+        if c is None:
             raise MalfunctionError(
                 f"no initialized controller found for class {C},"
                 f" but it was declared in imported module {m},"
                 " so DI should have been initialized it"
             )
+        elif isinstance(c, HTTPController):
+            self.__register_http_for_module(c, m)
+        elif isinstance(c, WebsocketController):
+            self.__register_websocket_controller_for_module(c, m)
+        else:
+            raise TypeError(
+                f"controller unsupported type {type(c)}"
+            )
 
     def __register_http_for_module(
         self,
         c: HTTPController,
         m: Module
     ) -> None:
-        # At least one method found
-        is_method_found: bool = False
-        for http_method in HTTPMethod:
-            # Don't register unused methods
-            if http_method in c.methods:
-                is_method_found = True
-
-                self.__router.register_route(
-                    # We can concatenate routes such way since routes
-                    # are validated to not contain following slash
-                    # -> But join_routes() handles this situation, doesn't it?
-                    route=web.join_routes(m.route, c.route),
-                    fn=c.get_fn_by_http_method(http_method),
-                    method=http_method
-                )
-
-        if not is_method_found:
+        # At least one method should be defined
+        if not c.methods:
             raise MalfunctionError(
                 f"no http methods found for controller {c.__class__},"
                 " this shouldn't have passed validation at Controller.__init__"
             )
 
+        # We can concatenate routes such way since routes
+        # are validated to not contain following slash
+        # -> But join_routes() handles this situation, doesn't it?
+        #
+        # Route is the same for all controller's methods, so it's joined once
+        route: str = web.join_routes(m.route, c.route)
+
+        # Only methods used by the controller are iterated
+        for http_method in c.methods:
+            self.__router.register_route(
+                route=route,
+                fn=c.get_fn_by_http_method(http_method),
+                method=http_method
+            )
+
     def __register_websocket_controller_for_module(
         self,
         c: WebsocketController,
@@ -371,7 +460,7 @@ class Boot(Worker):
         )
 
     def __parse_mode(self) -> BootMode:
-        mode_env: str | None = os.getenv("Orwynn_Mode")
+        mode_env: str | None = os.environ.get(_ENV_MODE)
 
         if not mode_env:
             return BootMode.DEV
@@ -380,29 +469,21 @@ class Boot(Worker):
 
     def __parse_root_dir(self) -> Path:
         root_dir: Path
-        root_dir_env: str = os.getenv("Orwynn_RootDir", "")
+        root_dir_env: str = os.environ.get(_ENV_ROOT_DIR, "")
 
         if not root_dir_env:
-            root_dir = Path(os.getcwd())
+            root_dir = Path.cwd()
         else:
             root_dir = Path(root_dir_env)
 
-        if not root_dir.is_dir():
-            raise NotDirError(
-                f"{root_dir} is not a directory"
-            )
-
-        return root_dir
+        return _require_dir(root_dir)
 
     def __parse_app_rc(self, root_dir: Path, mode: BootMode) -> AppRC:
 
         # All required for this enabled mode data goes here
         final_app_rc: dict = {}
 
-        rc_path_env: str = os.getenv(
-            "Orwynn_AppRCPath",
-            ""
-        )
+        rc_path_env: str = os.environ.get(_ENV_APP_RC_PATH, "")
         should_raise_search_error: bool
 
         rc_path: Path
@@ -416,33 +497,15 @@ class Boot(Worker):
             rc_path = Path(root_dir, rc_path_env)
             should_raise_search_error = True
 
-        if Path(rc_path).exists():
-            # Here goes all data contained in yaml config
-            app_rc: AppRC = load_yml(rc_path)
-
-            if app_rc == {} and should_raise_search_error:
-                raise ValueError(f"apprc on path {rc_path} is empty")
-
-            # Check if apprc contains any unsupported top-level keys
-            for k in app_rc.keys():
-                supported_top_level_keys: list[str] = [
-                    x.value for x in BootMode
-                ]
-                if k not in supported_top_level_keys:
-                    raise ValueError(
-                        f"unsupported top-level key \"{k}\" of apprc config"
-                    )
-
-            # Load from bottom to top updating previous one with newest one
-            mode_nesting_index: int = APP_RC_MODE_NESTING.index(mode)
-            for nesting_mode in APP_RC_MODE_NESTING[:mode_nesting_index + 1]:
-                # Supress: We don't mind if any top-level key is missing here
-                with contextlib.suppress(KeyError):
-                    final_app_rc.update(app_rc[nesting_mode.value])
-        elif (
-            rc_path_env.startswith("http://")
-            or rc_path_env.startswith("https://")
-        ):
+        rc_mtime: int | None = self.__stat_app_rc_mtime(rc_path)
+        if rc_mtime is not None:
+            final_app_rc = self.__load_app_rc(
+                rc_path,
+                mode,
+                rc_mtime=rc_mtime,
+                should_raise_search_error=should_raise_search_error
+            )
+        elif rc_path_env.startswith(_URL_SCHEMES):
             raise NotImplementedError("URL sources are not yet implemented")
         elif should_raise_search_error:
             raise AppRCSearchError(
@@ -451,10 +514,89 @@ class Boot(Worker):
 
         return final_app_rc
 
+    @staticmethod
+    def __stat_app_rc_mtime(rc_path: Path) -> int | None:
+        # Existence check and modification time fetched by single stat call
+        try:
+            return rc_path.stat().st_mtime_ns
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+
+    def __load_app_rc(
+        self,
+        rc_path: Path,
+        mode: BootMode,
+        *,
+        rc_mtime: int,
+        should_raise_search_error: bool
+    ) -> AppRC:
+        # Parsed configs are cached since the same apprc is usually loaded by
+        # many Boots within a process (e.g. in tests). Modification time is
+        # a part of the key to not return stale data for a changed file.
+        # Cached entry is reused only if environment variables substituted
+        # into it are unchanged.
+        cache_key: tuple[str, BootMode, int] = (str(rc_path), mode, rc_mtime)
+        cached: tuple[AppRC, dict[str, str | None]] | None = \
+            Boot.__app_rc_cache.get(cache_key)
+        if cached is not None and all(
+            os.environ.get(name) == value
+            for name, value in cached[1].items()
+        ):
+            # Deep copy since nested sections are mutable and shouldn't be
+            # shared between Boots
+            return copy.deepcopy(cached[0])
+
+        final_app_rc: AppRC = {}
+
+        # Here goes all data contained in yaml config
+        app_rc: AppRC
+        referenced_env: dict[str, str | None]
+        app_rc, referenced_env = load_yml_with_env(
+            rc_path, should_raise_unset=False
+        )
+
+        if app_rc == {} and should_raise_search_error:
+            raise ValueError(f"apprc on path {rc_path} is empty")
+
+        # Check if apprc contains any unsupported top-level keys
+        for k in app_rc.keys():
+            if k not in _SUPPORTED_APP_RC_KEYS:
+                raise ValueError(
+                    f"unsupported top-level key \"{k}\" of apprc config"
+                )
+
+        # Load from bottom to top updating previous one with newest one
+        for nesting_mode_value in _NESTED_MODE_VALUES_BY_MODE[mode]:
+            # We don't mind if any top-level key is missing here
+            section: AppRC | None = app_rc.get(nesting_mode_value)
+            if section:
+                final_app_rc.update(section)
+
+        # Replaced entries are moved to the end to be evicted last
+        Boot.__app_rc_cache.pop(cache_key, None)
+        if len(Boot.__app_rc_cache) >= _APP_RC_CACHE_MAX_SIZE:
+            # Evict the oldest entry
+            del Boot.__app_rc_cache[next(iter(Boot.__app_rc_cache))]
+        # Variables referenced only by sections not applied for this mode (or
+        # overriden by other sections) are not required to be set, e.g.
+        # production secrets for local development
+        unset_env_names: list[str] = [
+            name for name, value in referenced_env.items() if value is None
+        ]
+        if unset_env_names:
+            check_unset_env(final_app_rc, unset_env_names)
+
+        Boot.__app_rc_cache[cache_key] = (final_app_rc, referenced_env)
+        return copy.deepcopy(final_app_rc)
+
     def __enable_databases(self, database_kinds: list[DatabaseKind]) -> None:
         for kind in database_kinds:
             match kind:
                 case DatabaseKind.MONGO:
+                    # Imported here to not load mongo driver for apps which
+                    # don't use it
+                    from orwynn.mongo.Mongo import Mongo
+                    from orwynn.mongo.MongoConfig import MongoConfig
                     Mongo(
                         config=MongoConfig.load()
                     )
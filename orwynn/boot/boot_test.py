@@ -1,19 +1,28 @@
 import os
+from pathlib import Path
+from typing import Callable
 
-from pytest import fixture
+from pytest import MonkeyPatch, fixture
 
 from orwynn import validation
+from orwynn.app.App import App
 from orwynn.app_rc.AppRC import AppRC
 from orwynn.boot.Boot import Boot
 from orwynn.boot.BootMode import BootMode
 from orwynn.database.DatabaseKind import DatabaseKind
 from orwynn.di.DI import DI
+from orwynn.file.yml import UnsetEnvVarError
+from orwynn.log.LogConfig import LogConfig
 from orwynn.module.Module import Module
 from orwynn.mongo.Mongo import Mongo
 from orwynn.proxy.BootProxy import BootProxy
+from orwynn.service.Service import Service
+from orwynn.validation import expect
 from tests.std.text import TextConfig
 
 
+# Boot fixtures are function-scoped: Boot is a singleton Worker discarded after
+# each test, so every test should get its freshly constructed instance.
 @fixture
 def std_boot(std_struct: Module) -> Boot:
     return Boot(
@@ -28,7 +37,10 @@ def run_std(std_struct: Module):
 
 @fixture
 def std_mongo_boot(std_struct: Module) -> Boot:
-    os.environ["Orwynn_AppRCDir"] = os.path.join(os.getcwd(), "tests/std")
+    os.environ["Orwynn_AppRCPath"] = os.path.join(
+        os.getcwd(),
+        "tests/std/apprc.yml"
+    )
     return Boot(
         root_module=std_struct,
         databases=[DatabaseKind.MONGO]
@@ -144,3 +156,215 @@ def test_nested_configs_test(
     text_config: TextConfig = DI.ie().find("TextConfig")
 
     assert app_rc["Text"]["words_amount"] == text_config.words_amount == 3
+
+
+def test_app_rc_env_interpolation(
+    std_struct: Module,
+    set_prod_mode,
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch
+):
+    rc_path: Path = Path(tmp_path, "apprc.yml")
+    rc_path.write_text(
+        "prod:\n"
+        "  Text:\n"
+        "    words_amount: 1\n"
+        "    prefix: ${ORWYNN_TEST_PREFIX}-x\n"
+        "    double_quoted: \"mongodb://${ORWYNN_TEST_PREFIX}\"\n"
+        "    single_quoted: 'x-${ORWYNN_TEST_PREFIX}'\n"
+    )
+    monkeypatch.setenv("Orwynn_AppRCPath", str(rc_path))
+    monkeypatch.setenv("ORWYNN_TEST_PREFIX", "hello")
+
+    Boot(
+        root_module=std_struct
+    )
+
+    text_rc: dict = BootProxy.ie().app_rc["Text"]
+    assert text_rc["prefix"] == "hello-x"
+    assert text_rc["double_quoted"] == "mongodb://hello"
+    assert text_rc["single_quoted"] == "x-hello"
+
+
+def test_app_rc_env_other_mode_unset(
+    std_struct: Module,
+    set_dev_mode,
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch
+):
+    rc_path: Path = Path(tmp_path, "apprc.yml")
+    rc_path.write_text(
+        "prod:\n"
+        "  Text:\n"
+        "    password: \"${ORWYNN_TEST_PROD_PASSWORD}\"\n"
+        "dev:\n"
+        "  Text:\n"
+        "    words_amount: 2\n"
+    )
+    monkeypatch.setenv("Orwynn_AppRCPath", str(rc_path))
+    monkeypatch.delenv("ORWYNN_TEST_PROD_PASSWORD", raising=False)
+
+    Boot(
+        root_module=std_struct
+    )
+
+    assert BootProxy.ie().app_rc["Text"] == {"words_amount": 2}
+
+
+def test_app_rc_env_applied_unset(
+    std_struct: Module,
+    set_prod_mode,
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch
+):
+    rc_path: Path = Path(tmp_path, "apprc.yml")
+    rc_path.write_text(
+        "prod:\n"
+        "  Text:\n"
+        "    password: \"${ORWYNN_TEST_PROD_PASSWORD}\"\n"
+    )
+    monkeypatch.setenv("Orwynn_AppRCPath", str(rc_path))
+    monkeypatch.delenv("ORWYNN_TEST_PROD_PASSWORD", raising=False)
+
+    expect(Boot, UnsetEnvVarError, std_struct)
+
+
+@fixture
+def tmp_app_rc_path(tmp_path: Path, monkeypatch: MonkeyPatch) -> Path:
+    rc_path: Path = Path(tmp_path, "apprc.yml")
+    monkeypatch.setenv("Orwynn_AppRCPath", str(rc_path))
+    return rc_path
+
+
+def test_app_rc_cache_file_changed(
+    std_struct: Module,
+    set_prod_mode,
+    tmp_app_rc_path: Path,
+    discard_workers: Callable[[], None]
+):
+    tmp_app_rc_path.write_text("prod:\n  Text:\n    words_amount: 1\n")
+    Boot(std_struct)
+    assert BootProxy.ie().app_rc["Text"]["words_amount"] == 1
+
+    discard_workers()
+    mtime_ns: int = tmp_app_rc_path.stat().st_mtime_ns
+    tmp_app_rc_path.write_text("prod:\n  Text:\n    words_amount: 3\n")
+    # Ensure modification time is changed even on filesystems with coarse
+    # timestamps
+    os.utime(tmp_app_rc_path, ns=(mtime_ns, mtime_ns + 1_000_000))
+    Boot(std_struct)
+    assert BootProxy.ie().app_rc["Text"]["words_amount"] == 3
+
+
+def test_app_rc_cache_env_changed(
+    std_struct: Module,
+    set_prod_mode,
+    tmp_app_rc_path: Path,
+    monkeypatch: MonkeyPatch,
+    discard_workers: Callable[[], None]
+):
+    tmp_app_rc_path.write_text(
+        "prod:\n  Text:\n    prefix: ${ORWYNN_TEST_PREFIX}\n"
+    )
+    monkeypatch.setenv("ORWYNN_TEST_PREFIX", "hello")
+    Boot(std_struct)
+    assert BootProxy.ie().app_rc["Text"]["prefix"] == "hello"
+
+    discard_workers()
+    monkeypatch.setenv("ORWYNN_TEST_PREFIX", "world")
+    Boot(std_struct)
+    assert BootProxy.ie().app_rc["Text"]["prefix"] == "world"
+
+
+def test_app_rc_cache_mutation(
+    std_struct: Module,
+    set_prod_mode,
+    tmp_app_rc_path: Path,
+    discard_workers: Callable[[], None]
+):
+    tmp_app_rc_path.write_text("prod:\n  Text:\n    words_amount: 1\n")
+    # Mutate config given both on cache miss and on cache hit
+    for _ in range(2):
+        Boot(std_struct)
+        BootProxy.ie().app_rc["Text"]["words_amount"] = 5
+        discard_workers()
+
+    Boot(std_struct)
+    assert BootProxy.ie().app_rc["Text"]["words_amount"] == 1
+
+
+def test_dotenv_loaded_once(
+    std_struct: Module,
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    discard_workers: Callable[[], None]
+):
+    dotenv_path: Path = Path(tmp_path, ".env")
+    dotenv_path.write_text("ORWYNN_TEST_DOTENV=loaded\n")
+    monkeypatch.delenv("ORWYNN_TEST_DOTENV", raising=False)
+
+    Boot(std_struct, dotenv_path=dotenv_path)
+    assert os.environ["ORWYNN_TEST_DOTENV"] == "loaded"
+
+    discard_workers()
+    monkeypatch.setenv("ORWYNN_TEST_DOTENV", "changed")
+    Boot(std_struct, dotenv_path=dotenv_path)
+    assert os.environ["ORWYNN_TEST_DOTENV"] == "changed"
+
+    Boot.reload_dotenv(dotenv_path)
+    assert os.environ["ORWYNN_TEST_DOTENV"] == "loaded"
+
+
+def test_dotenv_created_after_boot(
+    std_struct: Module,
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    discard_workers: Callable[[], None]
+):
+    dotenv_path: Path = Path(tmp_path, ".env")
+    monkeypatch.delenv("ORWYNN_TEST_DOTENV", raising=False)
+
+    Boot(std_struct, dotenv_path=dotenv_path)
+    assert "ORWYNN_TEST_DOTENV" not in os.environ
+
+    discard_workers()
+    dotenv_path.write_text("ORWYNN_TEST_DOTENV=loaded\n")
+    Boot(std_struct, dotenv_path=dotenv_path)
+    assert os.environ["ORWYNN_TEST_DOTENV"] == "loaded"
+
+
+def test_root_module_providers_untouched(std_struct: Module):
+    Providers: list = std_struct.Providers
+
+    Boot(std_struct)
+
+    assert std_struct.Providers == Providers
+    assert App not in std_struct.Providers
+    assert LogConfig not in std_struct.Providers
+
+
+class _BuiltinDependentService(Service):
+    def __init__(self, app: App, log_config: LogConfig) -> None:
+        super().__init__()
+        self.app = app
+        self.log_config = log_config
+
+
+def test_non_root_provider_builtin_dependencies():
+    Boot(
+        Module(
+            route="/",
+            imports=[
+                Module(
+                    route="/child",
+                    Providers=[_BuiltinDependentService]
+                )
+            ]
+        )
+    )
+
+    service: _BuiltinDependentService = DI.ie().find(
+        "_BuiltinDependentService"
+    )
+    assert service.app is DI.ie().find("App")
+    assert service.log_config is DI.ie().find("LogConfig")
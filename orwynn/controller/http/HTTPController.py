@@ -10,6 +10,8 @@ from orwynn.proxy.EndpointProxy import EndpointProxy
 from orwynn import validation
 from orwynn.web import HTTPMethod, UnsupportedHTTPMethodError
 
+_SUPPORTED_STR_METHODS: frozenset[str] = frozenset(e.value for e in HTTPMethod)
+
 
 class HTTPController(Controller):
     """Handles incoming requests and returns responses to the client.
@@ -63,7 +65,7 @@ class HTTPController(Controller):
             for endpoint in self.ENDPOINTS:
                 str_method = endpoint.method.lower()
 
-                if str_method not in [e.value for e in HTTPMethod]:
+                if str_method not in _SUPPORTED_STR_METHODS:
                     raise UnsupportedHTTPMethodError(
                         f"method {str_method} is not supported"
                     )
@@ -1,3 +1,5 @@
+from typing import TypeVar, overload
+
 from orwynn.app.App import App
 from orwynn.app.ErrorHandler import ErrorHandler
 from orwynn.controller.Controller import Controller
@@ -9,11 +11,14 @@ from orwynn.di.DIContainer import DIContainer
 from orwynn.di.DIObject import DIObject
 from orwynn.di.init.init_other_acceptors import init_other_acceptors
 from orwynn.di.init.init_providers import init_providers
+from orwynn.di.provider import Provider
 from orwynn.middleware.Middleware import Middleware
 from orwynn.module.Module import Module
 from orwynn.validation import validate
 from orwynn.worker.Worker import Worker
 
+_FoundObj = TypeVar("_FoundObj")
+
 
 class DI(Worker):
     """Resolves Dependency-injection related tasks for an application.
@@ -42,8 +47,16 @@ class DI(Worker):
     Attributes:
         root_module:
             Root module of the app.
+        extra_providers (optional):
+            List of providers available for all modules without being
+            referenced in them, e.g. crucial framework's providers.
     """
-    def __init__(self, root_module: Module) -> None:
+    def __init__(
+        self,
+        root_module: Module,
+        *,
+        extra_providers: list[type[Provider]] | None = None
+    ) -> None:
         super().__init__()
         validate(root_module, Module)
 
@@ -53,19 +66,13 @@ class DI(Worker):
 
         self.modules: list[Module] = collect_modules(root_module)
         self.__container: DIContainer = init_providers(
-            collect_provider_dependencies(self.modules)
+            collect_provider_dependencies(self.modules, extra_providers)
         )
         init_other_acceptors(self.__container, self.modules)
 
     @property
     def app_service(self) -> App:
-        app = self.find("App")
-        if isinstance(app, App):
-            return app
-        else:
-            raise TypeError(
-                f"{app} is not an App instance"
-            )
+        return self.find(App)
 
     @property
     def controllers(self) -> list[Controller]:
@@ -89,7 +96,15 @@ class DI(Worker):
     def error_handlers(self) -> list[ErrorHandler]:
         return self.__container.error_handlers
 
+    @overload
+    def find(self, key: type[_FoundObj]) -> _FoundObj:
+        ...
+
+    @overload
     def find(self, key: str) -> DIObject:
+        ...
+
+    def find(self, key: type | str) -> DIObject:
         """Returns DI object by its key.
 
         Note that searching is made using PascalCased keys, but actual object
@@ -97,7 +112,8 @@ class DI(Worker):
 
         Args:
             key:
-                String value to search with.
+                String value to search with, or exact class of searched
+                object.
 
         Returns:
             A DIObject found.
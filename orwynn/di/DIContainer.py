@@ -1,5 +1,5 @@
 import re
-from typing import TypeVar
+from typing import TypeVar, overload
 
 from orwynn.app.ErrorHandler import ErrorHandler
 from orwynn.config.Config import Config
@@ -24,6 +24,8 @@ class DIContainer:
     """Holds data about initialized di objects."""
     def __init__(self) -> None:
         self._data: dict[str, DIObject] = {}
+        # Same objects keyed by their classes for lookups by class
+        self._data_by_class: dict[type[DIObject], DIObject] = {}
 
         # Struct running in parallel to main data one to hold references by
         # class for self properties like getting all controllers
@@ -91,10 +93,19 @@ class DIContainer:
             )
 
         self._data[obj_class_name] = obj
+        self._data_by_class[type(obj)] = obj
 
         self._assign_obj_to_base_class(obj)
 
+    @overload
+    def find(self, key: type[_InnerObj]) -> _InnerObj:
+        ...
+
+    @overload
     def find(self, key: str) -> DIObject:
+        ...
+
+    def find(self, key: type | str) -> DIObject:
         """Returns DI object by its key.
 
         Note that searching is made using PascalCased keys, but actual object
@@ -102,7 +113,8 @@ class DIContainer:
 
         Args:
             key:
-                String value to search with.
+                String value to search with, or exact class of searched
+                object.
 
         Returns:
             A DIObject found.
@@ -111,9 +123,10 @@ class DIContainer:
             MissingDIObjectError:
                 DIObject with given key is not found.
         """
-        validate(key, str)
-
         try:
+            if isinstance(key, type):
+                return self._data_by_class[key]
+            validate(key, str)
             return self._data[key]
         except KeyError as error:
             raise MissingDIObjectError(
@@ -7,7 +7,7 @@ from orwynn.validation import expect
 from tests.std.Assertion import Assertion
 
 
-@fixture
+@fixture(scope="session")
 def std_modules(std_struct: Module) -> list[Module]:
     return collect_modules(std_struct)
 
@@ -21,25 +21,39 @@ from orwynn.service.framework_service import FrameworkService
 
 
 def collect_provider_dependencies(
-    modules: list[Module]
+    modules: list[Module],
+    extra_providers: list[type[Provider]] | None = None
 ) -> ProviderDependenciesMap:
     """Collects providers and their dependencies from given modules.
 
     Args:
         modules:
-            List of modules to collect providers from.
+            List of modules to collect providers from. First module is
+            considered as the root one.
+        extra_providers (optional):
+            List of providers not referenced in any module, but available to
+            all of them, e.g. crucial framework's providers added by Boot.
+            Their own dependencies are searched within the root module.
 
     Returns:
         Special structure maps providers and their dependencies.
     """
+    if extra_providers is None:
+        extra_providers = []
+
     metamap: ProviderDependenciesMap = ProviderDependenciesMap()
 
+    # Extra providers are traversed first to be in the map before any
+    # provider requesting them
+    for P in extra_providers:
+        _traverse(P, metamap, [], modules[0], extra_providers)
+
     # Traverse all parameters of all providers in all modules to add them in
     # united structure
     for module in modules:
-        for P in module.Providers:
+        for P in module._Providers:
             # Chain is cleared for every new provider iterated
-            _traverse(P, metamap, [], module)
+            _traverse(P, metamap, [], module, extra_providers)
 
     return metamap
 
@@ -48,7 +62,8 @@ def _traverse(
     P: type[Provider],
     metamap: ProviderDependenciesMap,
     chain: list[type[Provider]],
-    target_module: Module | None
+    target_module: Module | None,
+    extra_providers: list[type[Provider]]
 ):
     # Recursively traverses over Provider parameters, memorizing chain to
     # find circular dependencies and saving results to metamap.  Target module
@@ -82,7 +97,8 @@ def _traverse(
             nested_module: Module | None = _check_availability(
                 P,
                 parameter.DependencyProvider,
-                target_module
+                target_module,
+                extra_providers
             )
             metamap.add_dependency(
                 dependency=parameter.DependencyProvider,
@@ -93,7 +109,8 @@ def _traverse(
                 parameter.DependencyProvider,
                 metamap,
                 chain,
-                nested_module
+                nested_module,
+                extra_providers
             )
 
     # Pop blocking element.  For this concept see collect_modules._traverse
@@ -104,7 +121,8 @@ def _traverse(
 def _check_availability(
     P1: type[Provider],
     P2: type[Provider],
-    P1_module: Module | None
+    P1_module: Module | None,
+    extra_providers: list[type[Provider]]
 ) -> Module | None:
     # Check if P2 is available to P1, module is required to start searching
     # from. Returns the module where P2 is located or None if P2 is a
@@ -133,7 +151,9 @@ def _check_availability(
             TargetProvider=P2
         )
         if found_module is None:
-            is_error = True
+            # Extra providers are available for every module, and have been
+            # already traversed within the root module
+            is_error = P2 not in extra_providers
         else:
             is_error = False
             res = found_module
@@ -159,7 +179,7 @@ def _search_matching_provider(
     res: Module | None = None
     is_found: bool = False
 
-    for P in target_module.Providers:
+    for P in target_module._Providers:
         if P is TargetProvider:
             # Available within the same module
             is_found = True
@@ -1,42 +1,49 @@
+import functools
 import inspect
 
 from pytest import fixture
 
+from orwynn.app.App import App
 from orwynn.config.Config import Config
-from orwynn.di.collecting.collect_modules import collect_modules
 from orwynn.di.collecting.collect_provider_dependencies import (
     ProviderDependenciesMap,
     collect_provider_dependencies,
 )
 from orwynn.di.is_provider import is_provider
 from orwynn.di.provider import Provider
+from orwynn.log.LogConfig import LogConfig
 from orwynn.module.Module import Module
-from orwynn.proxy.BootProxy import BootProxy
 from tests.std.Assertion import Assertion
 
 
-@fixture
+@functools.cache
+def _sig(P: type) -> inspect.Signature:
+    return inspect.signature(P)
+
+
+@fixture(scope="session")
 def std_provider_dependencies_map(
-    std_boot_data_proxy: BootProxy,
     std_modules: list[Module]
 ) -> ProviderDependenciesMap:
-    return collect_provider_dependencies(std_modules)
+    # Collecting is deterministic for the std struct and doesn't require boot
+    # data, so it's done once per session. Fixtures initializing providers
+    # should request boot data proxy on their own.
+    return collect_provider_dependencies(std_modules, [App, LogConfig])
 
 
-def test_std(std_struct: Module):
-    metamap: ProviderDependenciesMap = collect_provider_dependencies(
-        collect_modules(std_struct)
-    )
+def test_std(std_provider_dependencies_map: ProviderDependenciesMap):
+    metamap: ProviderDependenciesMap = std_provider_dependencies_map
 
     # Order doesn't matter
     assert set(metamap.Providers) == set(Assertion.COLLECTED_PROVIDERS)
 
     for P, dependencies in metamap.mapped_items:
         assertion_dependencies: list[type[Provider]] = []
-        for inspect_parameter in inspect.signature(P).parameters.values():
+        is_config: bool = issubclass(P, Config)
+        for inspect_parameter in _sig(P).parameters.values():
             # Skip config's parseable parameters
             if (
-                issubclass(P, Config)
+                is_config
                 and (
                     not inspect.isclass(inspect_parameter.annotation)
                     or not is_provider(inspect_parameter.annotation)
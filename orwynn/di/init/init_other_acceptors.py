@@ -27,7 +27,7 @@ def init_other_acceptors(
     for module in modules:
         module_covered_routes_for_middleware: list[str] = []
 
-        for C in module.Controllers:
+        for C in module._Controllers:
             validate(C, Controller)
 
             controller: Controller = C(
@@ -43,7 +43,7 @@ def init_other_acceptors(
                     module.route, controller.route
                 ))
 
-        for Mw in module.Middleware:
+        for Mw in module._Middleware:
             validate(Mw, Middleware)
             container.add(
                 Mw(
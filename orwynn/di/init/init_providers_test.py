@@ -3,10 +3,12 @@ from orwynn.di.collecting.provider_dependencies_map import (
 )
 from orwynn.di.DIContainer import DIContainer
 from orwynn.di.init.init_providers import init_providers
+from orwynn.proxy.BootProxy import BootProxy
 from tests.std.Assertion import Assertion
 
 
 def test_std(
+    std_boot_data_proxy: BootProxy,
     std_provider_dependencies_map: ProviderDependenciesMap
 ):
     container: DIContainer = init_providers(
@@ -15,3 +17,15 @@ def test_std(
 
     for P in Assertion.COLLECTED_PROVIDERS:
         isinstance(container.find(P.__name__), P)
+
+
+def test_find_by_class(
+    std_boot_data_proxy: BootProxy,
+    std_provider_dependencies_map: ProviderDependenciesMap
+):
+    container: DIContainer = init_providers(
+        std_provider_dependencies_map
+    )
+
+    for P in Assertion.COLLECTED_PROVIDERS:
+        assert container.find(P) is container.find(P.__name__)
@@ -1,5 +1,7 @@
 from orwynn.di.BUILTIN_ACCEPTORS import BUILTIN_ACCEPTORS
 
+_BUILTIN_ACCEPTORS_TUPLE: tuple[type, ...] = tuple(BUILTIN_ACCEPTORS)
+
 
 def is_acceptor(Class: type) -> bool:
     """Checks if given class is an Acceptor.
@@ -11,4 +13,4 @@ def is_acceptor(Class: type) -> bool:
     Returns:
         Flag signifies if given class is an Acceptor.
     """
-    return issubclass(Class, tuple(BUILTIN_ACCEPTORS))
+    return issubclass(Class, _BUILTIN_ACCEPTORS_TUPLE)
@@ -1,5 +1,7 @@
 from orwynn.di.BUILTIN_PROVIDERS import BUILTIN_PROVIDERS
 
+_BUILTIN_PROVIDERS_TUPLE: tuple[type, ...] = tuple(BUILTIN_PROVIDERS)
+
 
 def is_provider(Class: type) -> bool:
     """Checks if given class is a Provider.
@@ -11,4 +13,4 @@ def is_provider(Class: type) -> bool:
     Returns:
         Flag signifies if given class is a Provider.
     """
-    return issubclass(Class, tuple(BUILTIN_PROVIDERS))
+    return issubclass(Class, _BUILTIN_PROVIDERS_TUPLE)
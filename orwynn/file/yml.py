@@ -1,22 +1,21 @@
 """Operation with yml.
 """
+import os
+import re
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Collection
 
 import yaml
 
 from orwynn.validation import validate
 
+_YML_SUFFIXES: frozenset[str] = frozenset((".yaml", ".yml"))
+_ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}")
+_STR_TAG: str = "tag:yaml.org,2002:str"
 
-class YmlLoader(Enum):
-    """Yaml loaders types according to
-    https://github.com/yaml/pyyaml/wiki/PyYAML-yaml.load(input)-Deprecation
-    """
-    BASE = yaml.SafeLoader
-    SAFE = yaml.FullLoader
-    FULL = yaml.BaseLoader
-    UNSAFE = yaml.UnsafeLoader
+# Use libyaml bindings if pyyaml was built with them
+_BaseSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 class NotValidYmlError(Exception):
@@ -27,6 +26,85 @@ class NotValidFileSuffixError(Exception):
     pass
 
 
+class UnsetEnvVarError(Exception):
+    """If yml references environment variable which is not set."""
+
+
+class _EnvSafeLoader(_BaseSafeLoader):
+    """Safe loader substituting "${VAR}" occurences in string values with
+    values of according environment variables.
+
+    Substitution is made on composed nodes right before their construction,
+    so no additional pass over loaded data is required. Both plain and quoted
+    values are substituted, mapping keys are left as is.
+
+    Attributes:
+        referenced_env:
+            Names of environment variables referenced by the document with
+            their substituted values. Unset variables have None value and
+            their placeholders are left untouched, if the loader is created
+            with should_raise_unset=False.
+    """
+    def __init__(
+        self, stream: Any, *, should_raise_unset: bool = True
+    ) -> None:
+        super().__init__(stream)
+        self.referenced_env: dict[str, str | None] = {}
+        self.__should_raise_unset: bool = should_raise_unset
+
+    def construct_document(self, node: yaml.Node) -> Any:
+        self.__substitute_env(node)
+        return super().construct_document(node)
+
+    def __substitute_env(self, root: yaml.Node) -> None:
+        nodes: list[yaml.Node] = [root]
+        # Aliased nodes are shared (and might be recursive), so each node is
+        # visited once
+        visited_ids: set[int] = set()
+
+        while nodes:
+            node: yaml.Node = nodes.pop()
+            if id(node) in visited_ids:
+                continue
+            visited_ids.add(id(node))
+
+            if isinstance(node, yaml.MappingNode):
+                nodes.extend(value_node for _, value_node in node.value)
+            elif isinstance(node, yaml.SequenceNode):
+                nodes.extend(node.value)
+            elif node.tag == _STR_TAG and "$" in node.value:
+                node.value = _ENV_VAR_PATTERN.sub(
+                    self.__replace_env_var, node.value
+                )
+
+    def __replace_env_var(self, match: re.Match) -> str:
+        name: str = match.group(1)
+        value: str | None = os.environ.get(name)
+        self.referenced_env[name] = value
+
+        if value is not None:
+            return value
+        elif self.__should_raise_unset:
+            raise UnsetEnvVarError(
+                f"environment variable {name} is not set"
+            )
+        return match.group(0)
+
+
+class YmlLoader(Enum):
+    """Yaml loaders types according to
+    https://github.com/yaml/pyyaml/wiki/PyYAML-yaml.load(input)-Deprecation
+
+    ENV is a safe loader with substitution of "${VAR}" environment
+    variables.
+    """
+    BASE = yaml.SafeLoader
+    SAFE = yaml.FullLoader
+    FULL = yaml.BaseLoader
+    UNSAFE = yaml.UnsafeLoader
+    ENV = _EnvSafeLoader
+
+
 def load_yml(
     p: Path, *, loader: YmlLoader = YmlLoader.SAFE
 ) -> dict[str, Any]:
@@ -48,22 +126,107 @@ def load_yml(
             Suffix should be either ".yml" or ".yaml".
         NotValidYmlError:
             Yaml file is not valid.
+        UnsetEnvVarError:
+            Referenced environment variable is not set (only for ENV
+            loader).
     """
+    with _open_yml(p) as file:
+        return _check_yml_data(
+            yaml.load(file, Loader=loader.value)  # noqa: S506
+        )
+
+
+def load_yml_with_env(
+    p: Path, *, should_raise_unset: bool = True
+) -> tuple[dict[str, Any], dict[str, str | None]]:
+    """Loads yaml from file substituting "${VAR}" environment variables.
+
+    Args:
+        p:
+            Path of yaml file to load from.
+        should_raise_unset (optional):
+            Whether to raise an error for referenced variables which are not
+            set. If False, placeholders of such variables are left as is,
+            and it's up to the caller to check if they are used, e.g. with
+            check_unset_env(...). Defaults to True.
+
+    Returns:
+        Loaded dictionary from yaml file and names of environment variables
+        referenced in it with their substituted values (None for unset ones).
+
+    Raise:
+        TypeError:
+            Given path is not allowed pathlib.Path kind.
+        NotValidFileSuffixError:
+            Suffix should be either ".yml" or ".yaml".
+        NotValidYmlError:
+            Yaml file is not valid.
+        UnsetEnvVarError:
+            Referenced environment variable is not set.
+    """
+    with _open_yml(p) as file:
+        loader: _EnvSafeLoader = _EnvSafeLoader(
+            file, should_raise_unset=should_raise_unset
+        )
+        try:
+            data: Any = loader.get_single_data()
+        finally:
+            loader.dispose()
+
+    return _check_yml_data(data), loader.referenced_env
+
+
+def check_unset_env(data: Any, unset_names: Collection[str]) -> None:
+    """Checks that string values of loaded data don't contain placeholders
+    of given unset environment variables.
+
+    Args:
+        data:
+            Loaded data to check.
+        unset_names:
+            Names of unset environment variables.
+
+    Raise:
+        UnsetEnvVarError:
+            Placeholder of unset variable is found.
+    """
+    objs: list[Any] = [data]
+    visited_ids: set[int] = set()
+
+    while objs:
+        obj: Any = objs.pop()
+        if isinstance(obj, dict | list):
+            if id(obj) in visited_ids:
+                continue
+            visited_ids.add(id(obj))
+            objs.extend(obj.values() if isinstance(obj, dict) else obj)
+        elif isinstance(obj, str) and "$" in obj:
+            for match in _ENV_VAR_PATTERN.finditer(obj):
+                if match.group(1) in unset_names:
+                    raise UnsetEnvVarError(
+                        f"environment variable {match.group(1)} is not set"
+                    )
+
+
+def _open_yml(p: Path) -> BinaryIO:
     validate(p, Path)
 
-    if p.suffix.lower() not in [".yaml", ".yml"]:
+    if p.suffix.lower() not in _YML_SUFFIXES:
         raise NotValidFileSuffixError(f"suffix {p.suffix} is not valid suffix")
 
-    with open(p) as file:
-        data = yaml.load(file, Loader=loader.value)  # noqa: S506
-        if data is None:
-            # Empty files should return empty dicts
-            data = {}
-        # Is it necessary? Does pyyaml allow loading not-valid yaml files?
-        elif type(data) is not dict:
-            raise NotValidYmlError(
-                "Yaml file should contain any map-like structure,"
-                " not plain types"
-            )
-
+    # Opened in binary mode to let the parser decode the stream itself (yaml
+    # is utf-8/16/32 by spec) without an additional python-level text layer
+    return p.open("rb")
+
+
+def _check_yml_data(data: Any) -> dict[str, Any]:
+    if data is None:
+        # Empty files should return empty dicts
+        return {}
+    # Is it necessary? Does pyyaml allow loading not-valid yaml files?
+    elif type(data) is not dict:
+        raise NotValidYmlError(
+            "Yaml file should contain any map-like structure,"
+            " not plain types"
+        )
     return data
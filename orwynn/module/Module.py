@@ -1,4 +1,3 @@
-import copy
 from types import NoneType
 
 from orwynn.app.EmptyRouteError import EmptyRouteError
@@ -10,8 +9,16 @@ from orwynn.middleware.Middleware import Middleware as MiddlewareClass
 from orwynn.module.framework_service_module_reference_error import (
     FrameworkServiceModuleReferenceError,
 )
+from orwynn.module.unprovided_export_error import UnprovidedExportError
 from orwynn.service.framework_service import FrameworkService
-from orwynn.validation import validate, validate_route
+from orwynn.validation import (
+    ValidationError,
+    validate,
+    validate_each,
+    validate_route,
+)
+
+_LIST_OR_NONE: tuple[type, ...] = (list, NoneType)
 
 
 class Module:
@@ -61,12 +68,13 @@ class Module:
         exports: list[type[Provider]] | None = None
     ) -> None:
         super().__init__()
-        validate(route, str)
-        validate(Providers, [list, NoneType])
-        validate(Controllers, [list, NoneType])
-        validate(Middleware, [list, NoneType])
-        validate(imports, [list, NoneType])
-        validate(exports, [list, NoneType])
+        if not isinstance(route, str):
+            raise ValidationError(failed_obj=route, expected_type=str)
+        for field in (Providers, Controllers, Middleware, imports, exports):
+            if not isinstance(field, _LIST_OR_NONE):
+                raise ValidationError(
+                    failed_obj=field, expected_type=[list, NoneType]
+                )
 
         self._route: str = self._parse_route(route)
         self._Providers: list[type[Provider]] = self._parse_providers(
@@ -78,8 +86,7 @@ class Module:
         self._Middleware: list[type[MiddlewareClass]] = \
             self._parse_middleware(Middleware)
         self._imports: list["Module"] = self._parse_imports(imports)
-        # TODO: Add check if exports present in Providers
-        self._exports: list[type[Provider]] = self._parse_providers(Providers)
+        self._exports: list[type[Provider]] = self._parse_exports(exports)
 
     def __repr__(self) -> str:
         return "<{} \"{}\" at {}>".format(
@@ -94,23 +101,23 @@ class Module:
 
     @property
     def Providers(self) -> list[type[Provider]]:
-        return copy.copy(self._Providers)
+        return self._Providers[:]
 
     @property
     def Controllers(self) -> list[type[Controller]]:
-        return copy.copy(self._Controllers)
+        return self._Controllers[:]
 
     @property
     def Middleware(self) -> list[type[MiddlewareClass]]:
-        return copy.copy(self._Middleware)
+        return self._Middleware[:]
 
     @property
     def imports(self) -> list["Module"]:
-        return copy.copy(self._imports)
+        return self._imports[:]
 
     @property
     def exports(self) -> list[type[Provider]]:
-        return copy.copy(self._exports)
+        return self._exports[:]
 
     @staticmethod
     def _parse_route(route: str) -> str:
@@ -158,6 +165,27 @@ class Module:
 
         return res
 
+    def _parse_exports(
+        self,
+        exports: list[type[Provider]] | None
+    ) -> list[type[Provider]]:
+        res: list[type[Provider]]
+
+        if exports:
+            # Providers are already validated, so it's enough to check that
+            # exported ones are among them
+            for P in exports:
+                if P not in self._Providers:
+                    raise UnprovidedExportError(
+                        f"exported provider {P} is not referenced in"
+                        f" providers of the module {self}"
+                    )
+            res = exports
+        else:
+            res = []
+
+        return res
+
     @staticmethod
     def _parse_controllers(
         Controllers: list[type[Controller]] | None
@@ -165,9 +193,8 @@ class Module:
         res: list[type[Controller]]
 
         if Controllers:
-            for Controller_ in Controllers:
-                validate(Controller_, Controller)
-                # Rest validation done by controller itself
+            # Rest validation done by controller itself
+            validate_each(Controllers, Controller)
             res = Controllers
         else:
             res = []
@@ -181,8 +208,7 @@ class Module:
         res: list[type[MiddlewareClass]]
 
         if Middleware:
-            for Middleware_ in Middleware:
-                validate(Middleware_, MiddlewareClass)
+            validate_each(Middleware, MiddlewareClass)
             res = Middleware
         else:
             res = []
@@ -197,7 +223,10 @@ class Module:
 
         if imports:
             for import_ in imports:
-                validate(import_, Module)
+                if not isinstance(import_, Module):
+                    raise ValidationError(
+                        failed_obj=import_, expected_type=Module
+                    )
             res = imports
         else:
             res = []
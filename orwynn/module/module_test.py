@@ -0,0 +1,25 @@
+from orwynn.module.Module import Module
+from orwynn.module.unprovided_export_error import UnprovidedExportError
+from orwynn.validation import expect
+from tests.std.float import FloatService
+from tests.std.number import NumberService
+
+
+def test_exports():
+    m: Module = Module(
+        route="/m1",
+        Providers=[NumberService, FloatService],
+        exports=[FloatService]
+    )
+
+    assert m.exports == [FloatService]
+
+
+def test_unprovided_export():
+    expect(
+        Module,
+        UnprovidedExportError,
+        route="/m1",
+        Providers=[NumberService],
+        exports=[FloatService]
+    )
@@ -0,0 +1,5 @@
+from orwynn.error.Error import Error
+
+
+class UnprovidedExportError(Error):
+    pass
@@ -1,4 +1,4 @@
-from typing import Any, Callable
+from typing import Any, Callable, ClassVar
 
 from pymongo import MongoClient, ReturnDocument
 from pymongo.client_session import ClientSession
@@ -16,8 +16,12 @@ from orwynn.mongo.MongoEntity import MongoEntity
 
 class Mongo(Database):
     """Manages actions related to MongoDB."""
+    # Clients are shared across Mongo instances (e.g. ones reinitialized on
+    # every Boot) to reuse their connection pools
+    __clients: ClassVar[dict[tuple[str, int, int, int], MongoClient]] = {}
+
     def __init__(self, config: MongoConfig) -> None:
-        self.__client: MongoClient = MongoClient(config.uri)
+        self.__client: MongoClient = self.__get_client(config)
         self.__database: PymongoDatabase = self.__client[config.database_name]
         self.start_session: Callable[[], ClientSession] = \
             self.__client.start_session
@@ -25,6 +29,15 @@ class Mongo(Database):
     def drop_database(self) -> None:
         self.__client.drop_database(self.__database)
 
+    def truncate_collections(self) -> None:
+        """Deletes all documents from all collections of the database.
+
+        Unlike drop_database(), keeps collections and their indexes, so it's
+        cheaper to call frequently, e.g. between tests.
+        """
+        for name in self.__database.list_collection_names():
+            self.__database[name].delete_many({})
+
     def find_all(
         self,
         collection: str,
@@ -114,3 +127,24 @@ class Mongo(Database):
             )
 
         return validation.apply(updated_document, MongoEntity)
+
+    @classmethod
+    def __get_client(cls, config: MongoConfig) -> MongoClient:
+        key: tuple[str, int, int, int] = (
+            config.uri,
+            config.max_pool_size,
+            config.min_pool_size,
+            config.wait_queue_timeout_ms
+        )
+
+        try:
+            return cls.__clients[key]
+        except KeyError:
+            client: MongoClient = MongoClient(
+                config.uri,
+                maxPoolSize=config.max_pool_size,
+                minPoolSize=config.min_pool_size,
+                waitQueueTimeoutMS=config.wait_queue_timeout_ms
+            )
+            cls.__clients[key] = client
+            return client
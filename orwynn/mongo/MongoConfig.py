@@ -4,3 +4,6 @@ from orwynn.config.Config import Config
 class MongoConfig(Config):
     uri: str = "mongodb://localhost:27017"
     database_name: str
+    max_pool_size: int = 50
+    min_pool_size: int = 5
+    wait_queue_timeout_ms: int = 2000
@@ -24,7 +24,6 @@ from orwynn.router.WrongHandlerReturnTypeError import (
     WrongHandlerReturnTypeError,
 )
 from orwynn.web import HTTPMethod
-from orwynn.web.UnsupportedHTTPMethodError import UnsupportedHTTPMethodError
 from orwynn.worker.Worker import Worker
 
 
@@ -71,16 +70,6 @@ class Router(Worker):
         validation.validate(fn, Callable)
         validation.validate(method, HTTPMethod)
 
-        app_fn: Callable | None = \
-            self.__app.HTTP_METHODS_TO_REGISTERING_FUNCTIONS.get(
-                method, None
-            )
-
-        if not app_fn:
-            raise UnsupportedHTTPMethodError(
-                f"HTTP method {method} is not supported"
-            )
-
         if (
             route in self.__methods_by_route
             and method in self.__methods_by_route[route]
@@ -101,13 +90,15 @@ class Router(Worker):
         except EndpointNotFoundError:
             spec = None
 
-        app_fn(
-            route,
+        self.__app.register_route_fn(
+            route=route,
+            fn=fn,
+            methods=[method],
             **self.__parse_endpoint_spec_kwargs(
                 spec,
                 fn
             )
-        )(fn)
+        )
 
     def __parse_endpoint_spec_kwargs(
         self, spec: Endpoint | None, fn: Callable
@@ -25,6 +25,9 @@ class SingletonMeta(type):
                 f"{cannot_message} - class {cls} not initialized"
             )
 
+    def is_initialized(cls) -> bool:
+        return cls in cls.__instances
+
     def discard(cls, should_validate: bool = True) -> None:
         if should_validate:
             cls.__validate_in_instances("cannot discard")
@@ -34,6 +37,8 @@ class SingletonMeta(type):
 
 class Singleton(metaclass=SingletonMeta):
     """Singleton base class."""
+    __slots__ = ()
+
     @classmethod
     def ie(cls: type[SingletonInstance]) -> SingletonInstance:
         """Gets the single instance of the Singleton.
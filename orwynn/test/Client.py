@@ -1,9 +1,8 @@
-import inspect
 from types import NoneType
 from typing import Any, Callable, TypeVar
 
-from orwynn.test.EmbeddedTestClient import EmbeddedTestClient
 from orwynn import validation
+from orwynn.test.EmbeddedTestClient import EmbeddedTestClient
 from orwynn.validation import validate
 from orwynn.web import TestResponse
 
@@ -18,6 +17,14 @@ class Client:
         validation.validate(client, EmbeddedTestClient)
         self._client: EmbeddedTestClient = client
         self.ws = self._client.websocket_connect
+        self._methods: dict[str, Callable] = {
+            "get": self._client.get,
+            "post": self._client.post,
+            "delete": self._client.delete,
+            "put": self._client.put,
+            "patch": self._client.patch,
+            "options": self._client.options
+        }
 
     def get_jsonify(
         self,
@@ -103,11 +110,8 @@ class Client:
         asserted_status_code: int | None = None,
         **kwargs
     ) -> TestResponse:
-        # Join method name and function to call inner resolver
-        # inspect.stack() is for resolving self method name, ref:
-        #   https://stackoverflow.com/a/5067654
         return self._get_test_response(
-            inspect.stack(), url, asserted_status_code, **kwargs)
+            "get", url, asserted_status_code, **kwargs)
 
     def post(
         self,
@@ -116,7 +120,7 @@ class Client:
         **kwargs
     ) -> TestResponse:
         return self._get_test_response(
-            inspect.stack(), url, asserted_status_code, **kwargs)
+            "post", url, asserted_status_code, **kwargs)
 
     def delete(
         self,
@@ -125,7 +129,7 @@ class Client:
         **kwargs
     ) -> TestResponse:
         return self._get_test_response(
-            inspect.stack(), url, asserted_status_code, **kwargs)
+            "delete", url, asserted_status_code, **kwargs)
 
     def put(
         self,
@@ -134,7 +138,7 @@ class Client:
         **kwargs
     ) -> TestResponse:
         return self._get_test_response(
-            inspect.stack(), url, asserted_status_code, **kwargs)
+            "put", url, asserted_status_code, **kwargs)
 
     def patch(
         self,
@@ -143,7 +147,7 @@ class Client:
         **kwargs
     ) -> TestResponse:
         return self._get_test_response(
-            inspect.stack(), url, asserted_status_code, **kwargs)
+            "patch", url, asserted_status_code, **kwargs)
 
     def options(
         self,
@@ -152,63 +156,41 @@ class Client:
         **kwargs
     ) -> TestResponse:
         return self._get_test_response(
-            inspect.stack(), url, asserted_status_code, **kwargs)
+            "options", url, asserted_status_code, **kwargs)
 
     def _get_test_response(
         self,
-        stack: list[inspect.FrameInfo],
+        method: str,
         url: str,
         asserted_status_code: int | None,
-        **kwargs
-    ) -> TestResponse:
-        request: str = " ".join([stack[0][3], url])
-        return self._resolve_request(request, asserted_status_code, **kwargs)
-
-    def _resolve_request(
-        self,
-        request: str,
-        asserted_status_code: int | None,
         **request_kwargs
     ) -> TestResponse:
         response: TestResponse
         test_client_method: Callable
-        method: str
-        url: str
 
-        validate(request, str)
+        validate(method, str)
+        validate(url, str)
         validate(asserted_status_code, [int, NoneType])
 
-        # Request example: "get /users/1"
-        method, url = request.split(" ")
-
-        # Also can accept uppercase "GET ..."
-        method = method.lower()
-
-        match method:
-            case "get":
-                test_client_method = self._client.get
-            case "post":
-                test_client_method = self._client.post
-            case "delete":
-                test_client_method = self._client.delete
-            case "put":
-                test_client_method = self._client.put
-            case "patch":
-                test_client_method = self._client.patch
-            case "options":
-                test_client_method = self._client.options
-            case _:
-                raise ValueError(f"Method {method} is not supported")
-
-        response: TestResponse = test_client_method(url, **request_kwargs)
+        # Also can accept uppercase "GET"
+        try:
+            test_client_method = self._methods[method.lower()]
+        except KeyError as error:
+            raise ValueError(f"Method {method} is not supported") from error
+
+        response = test_client_method(url, **request_kwargs)
 
         validate(response, TestResponse, is_strict=True)
 
-        if asserted_status_code is not None:
-            assert \
-                response.status_code == asserted_status_code, \
-                f"response status code {response.status_code}" \
-                f" != asserted status code {asserted_status_code};" \
+        if (
+            asserted_status_code is not None
+            and response.status_code != asserted_status_code
+        ):
+            # Raised explicitly to not be stripped under python -O
+            raise AssertionError(
+                f"response status code {response.status_code}"
+                f" != asserted status code {asserted_status_code};"
                 f" response content is {response.content}"
+            )
 
         return response
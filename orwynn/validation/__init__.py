@@ -26,6 +26,8 @@ ApplyExpectedType = TypeVar("ApplyExpectedType")
 model_validator = __pydantic_validator
 ModelValidationError = __PydanticValidationError
 
+_ROUTE_PATTERN: re.Pattern = re.compile(r"^\/(.+\/?)?$")
+
 
 # See in the next series...
 # def optimize(...) -> Any:
@@ -119,9 +121,22 @@ def validate_each(
         validate(obj, expected_sequence_type)
 
     is_empty: bool = True
-    for o in obj:
-        is_empty = False
-        validate(o, expected_type, is_strict=is_strict)
+    if not is_strict and isinstance(expected_type, type):
+        # Fast path for the most common case of non-strict type checking,
+        # made without calling validate() for each item
+        for o in obj:
+            is_empty = False
+            if not (
+                isinstance(o, expected_type)
+                or (isclass(o) and issubclass(o, expected_type))
+            ):
+                raise ValidationError(
+                    failed_obj=o, expected_type=expected_type
+                )
+    else:
+        for o in obj:
+            is_empty = False
+            validate(o, expected_type, is_strict=is_strict)
 
     if should_check_if_empty and is_empty:
         raise ValidationError("validated iterable shouldn't be empty")
@@ -219,7 +234,12 @@ def validate_route(route: str) -> None:
         ReValidationError:
             Route does not match route pattern.
     """
-    validate_re(route, r"^\/(.+\/?)?$")
+    # Precompiled pattern is used since routes are validated for every
+    # module and controller
+    if not _ROUTE_PATTERN.match(route):
+        raise ReValidationError(
+            failed_obj=route, pattern=_ROUTE_PATTERN.pattern
+        )
 
 
 def apply(
@@ -3,5 +3,7 @@ from orwynn.singleton.Singleton import Singleton
 
 class Worker(Singleton):
     """Does framework-related tasks, such as assembling of all app or DI."""
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__()
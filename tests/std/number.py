@@ -1,3 +1,5 @@
+import functools
+
 from orwynn.app.App import App
 from orwynn.controller.endpoint.Endpoint import Endpoint
 from orwynn.controller.http.HTTPController import HTTPController
@@ -6,6 +8,15 @@ from orwynn.service.Service import Service
 from tests.std.float import FloatService, float_module
 
 
+@functools.lru_cache(maxsize=1024)
+def _score(id: str) -> int:
+    # For ASCII strings bytes are equal to code points, so they are summed
+    # without calling ord() for every char
+    if id.isascii():
+        return sum(id.encode())
+    return sum(map(ord, id))
+
+
 class NumberService(Service):
     def __init__(self, app: App, float_service: FloatService) -> None:
         super().__init__()
@@ -13,12 +24,7 @@ class NumberService(Service):
         self._float_service = float_service
 
     def find(self, id: str) -> int:
-        number: int = 0
-
-        for x in id:
-            number += ord(x)
-
-        return number
+        return _score(id)
 
 
 class NumberController(HTTPController):
@@ -40,5 +46,6 @@ number_module = Module(
     route="/numbers",
     Providers=[NumberService],
     Controllers=[NumberController],
-    imports=[float_module]
+    imports=[float_module],
+    exports=[NumberService]
 )
@@ -11,9 +11,10 @@ from orwynn.module.Module import Module
 from tests.std.root_module import root_module as std_root_module
 
 
-@fixture
+@fixture(scope="session")
 def std_struct() -> Module:
-    # Some predefined configuration for testing
+    # Some predefined configuration for testing. It's a module-level object
+    # anyway, so no need to request it for every test
     return std_root_module
 
 